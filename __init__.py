@@ -11,20 +11,34 @@ from .uv_migrator_core import (
     MigrationResult,
     MigrationReport,
 )
-from .migrator import (
-    parse_init_yaml,
-    parse_requirements_txt,
-    github_url_to_package_name,
-    convert_requirements,
-    infer_layer,
-    generate_pyproject_toml,
-)
+
+# Migration helpers pull in PyYAML; load them on first attribute access
+# (PEP 562) so CLI start-up does not pay for it
+_MIGRATOR_EXPORTS = frozenset({
+    "parse_init_yaml",
+    "parse_init_toml",
+    "parse_requirements_txt",
+    "github_url_to_package_name",
+    "convert_requirements",
+    "infer_layer",
+    "generate_pyproject_toml",
+})
+
+
+def __getattr__(name: str):
+    """Resolve migrator exports lazily."""
+    if name in _MIGRATOR_EXPORTS:
+        from . import migrator
+        return getattr(migrator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "UVMigratorCore",
     "MigrationResult",
     "MigrationReport",
     "parse_init_yaml",
+    "parse_init_toml",
     "parse_requirements_txt",
     "github_url_to_package_name",
     "convert_requirements",
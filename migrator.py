@@ -2,7 +2,7 @@
 Migration logic for converting init.yaml to pyproject.toml.
 
 This module contains the core conversion functions for:
-- Parsing init.yaml and requirements.txt
+- Parsing init.yaml (or init.toml) and requirements.txt
 - Converting GitHub URLs to package names
 - Splitting requirements into dependencies and uv.sources
 - Inferring layer from module type
@@ -11,17 +11,47 @@ This module contains the core conversion functions for:
 
 from __future__ import annotations
 
+import functools
+import os
 import re
-from pathlib import Path
-from typing import Any, Optional
-from urllib.parse import urlparse
+import tomllib
+from typing import Any, Callable, Optional, TextIO
 
 import yaml
 
+try:
+    # libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from logger_util import Logger
 
-from .templates import generate_pyproject_content
+from .templates import generate_pyproject_content, write_pyproject_content
+
+
+# GitHub repository URL; captures the last path segment (repo name) sans .git.
+# Always applied with fullmatch, so the pattern carries no anchors.
+_GITHUB_URL_RE = re.compile(
+    r"(?:git\+)?[a-z][a-z0-9+.-]*://[^/?#]*github\.com[^/?#]*"
+    r"/[^/?#]+(?:/[^/?#]+)*?/([^/?#]+?)(?:\.git)?/?(?:[?#].*)?",
+    re.IGNORECASE,
+)
+_match_github_url = _GITHUB_URL_RE.fullmatch
+
+# Case-insensitive "github.com" probe; the bound search is what callers use
+_GITHUB_HOST_RE = re.compile(r"github\.com", re.IGNORECASE)
+_search_github_host = _GITHUB_HOST_RE.search
 
+# Package names use hyphens where module names use underscores
+_UNDERSCORE_TO_HYPHEN = str.maketrans({"_": "-"})
+
+# Parsed init.yaml / init.toml contents keyed by path, tagged with the mtime
+# they were read at
+_INIT_FILE_CACHE: dict[str, tuple[int, dict[str, Any]]] = {}
+
+# Shared by every migration helper; Logger construction is not free
+_LOGGER = Logger(name="UVMigrator")
 
 # Layer inference defaults by folder
 LAYER_DEFAULTS: dict[str, str] = {
@@ -40,13 +70,19 @@ DEV_CORES: set[str] = {
     "uv_migrator_core",  # This module itself is dev-only
 }
 
+# DEV_CORES as a name -> layer mapping, so infer_layer needs a single probe
+_DEV_CORE_LAYERS: dict[str, str] = dict.fromkeys(DEV_CORES, "dev")
+
 
-def parse_init_yaml(module_path: Path) -> dict[str, Any]:
+def parse_init_yaml(module_path: str | os.PathLike[str]) -> dict[str, Any]:
     """
     Parse init.yaml from a module directory.
     
+    Results are cached per path and reused until the file's mtime changes,
+    so callers must treat the returned dict as read-only.
+    
     Args:
-        module_path: Path to the module directory
+        module_path: Path to the module directory (str or path-like)
         
     Returns:
         Parsed init.yaml content as dict
@@ -55,49 +91,92 @@ def parse_init_yaml(module_path: Path) -> dict[str, Any]:
         FileNotFoundError: If init.yaml doesn't exist
         ValueError: If init.yaml is malformed
     """
-    init_yaml_path = module_path / "init.yaml"
+    init_yaml_path = os.path.join(module_path, "init.yaml")
+    
+    try:
+        mtime_ns = os.stat(init_yaml_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"No init.yaml found at {init_yaml_path}") from None
     
-    if not init_yaml_path.exists():
-        raise FileNotFoundError(f"No init.yaml found at {init_yaml_path}")
+    cached = _INIT_FILE_CACHE.get(init_yaml_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
     
     try:
-        with open(init_yaml_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f) or {}
+        with open(init_yaml_path, "rb") as f:
+            data = yaml.load(f.read(), Loader=_YamlLoader) or {}
     except yaml.YAMLError as e:
         raise ValueError(f"init.yaml at {init_yaml_path} is not valid YAML: {e}")
     
     if not isinstance(data, dict):
         raise ValueError(f"init.yaml at {init_yaml_path} is not a valid YAML dict")
     
+    _INIT_FILE_CACHE[init_yaml_path] = (mtime_ns, data)
     return data
 
 
-def parse_requirements_txt(module_path: Path) -> list[str]:
+def parse_init_toml(module_path: str | os.PathLike[str]) -> dict[str, Any]:
+    """
+    Parse init.toml, the TOML equivalent of init.yaml, from a module directory.
+    
+    Uses the stdlib tomllib parser and shares parse_init_yaml's mtime cache;
+    the returned dict must be treated as read-only.
+    
+    Args:
+        module_path: Path to the module directory (str or path-like)
+        
+    Returns:
+        Parsed init.toml content as dict
+        
+    Raises:
+        FileNotFoundError: If init.toml doesn't exist
+        ValueError: If init.toml is malformed
+    """
+    init_toml_path = os.path.join(module_path, "init.toml")
+    
+    try:
+        mtime_ns = os.stat(init_toml_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"No init.toml found at {init_toml_path}") from None
+    
+    cached = _INIT_FILE_CACHE.get(init_toml_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    
+    try:
+        with open(init_toml_path, "rb") as f:
+            data = tomllib.load(f)
+    except tomllib.TOMLDecodeError as e:
+        raise ValueError(f"init.toml at {init_toml_path} is not valid TOML: {e}")
+    
+    _INIT_FILE_CACHE[init_toml_path] = (mtime_ns, data)
+    return data
+
+
+def parse_requirements_txt(module_path: str | os.PathLike[str]) -> list[str]:
     """
     Parse requirements.txt from a module directory.
     
     Args:
-        module_path: Path to the module directory
+        module_path: Path to the module directory (str or path-like)
         
     Returns:
         List of PyPI requirements (empty if file doesn't exist)
     """
-    req_path = module_path / "requirements.txt"
+    req_path = os.path.join(module_path, "requirements.txt")
     
-    if not req_path.exists():
+    try:
+        with open(req_path, encoding="utf-8") as f:
+            text = f.read()
+    except FileNotFoundError:
         return []
     
-    requirements = []
-    with open(req_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            # Skip empty lines and comments
-            if line and not line.startswith("#"):
-                requirements.append(line)
-    
-    return requirements
+    # Skip empty lines and comments
+    lines = (line.strip() for line in text.splitlines())
+    return [line for line in lines if line and not line.startswith("#")]
 
 
+@functools.lru_cache(maxsize=512)
 def github_url_to_package_name(url: str) -> str:
     """
     Convert a GitHub URL to a package name.
@@ -121,28 +200,15 @@ def github_url_to_package_name(url: str) -> str:
     Raises:
         ValueError: If URL is not a valid GitHub URL
     """
-    parsed = urlparse(url)
-    
-    if "github.com" not in parsed.netloc:
-        raise ValueError(f"Not a GitHub URL: {url}")
-    
-    # Extract path and get repo name
-    path_parts = parsed.path.strip("/").split("/")
-    if len(path_parts) < 2:
-        raise ValueError(f"Invalid GitHub URL format: {url}")
-    
-    repo_name = path_parts[-1]
-    
-    # Remove .git suffix if present
-    if repo_name.endswith(".git"):
-        repo_name = repo_name[:-4]
+    match = _match_github_url(url.strip())
+    if match is None:
+        raise ValueError(f"Not a valid GitHub repository URL: {url}")
     
     # Convert to package name: lowercase, underscores to hyphens
-    package_name = repo_name.lower().replace("_", "-")
-    
-    return package_name
+    return match.group(1).lower().translate(_UNDERSCORE_TO_HYPHEN)
 
 
+@functools.lru_cache(maxsize=512)
 def is_github_url(requirement: str) -> bool:
     """Check if a requirement string is a GitHub URL.
     
@@ -150,7 +216,7 @@ def is_github_url(requirement: str) -> bool:
         Legacy function from the polyrepo-to-monorepo migration (v2 → v3).
         Monorepo modules now use `{ workspace = true }` in pyproject.toml.
     """
-    return "github.com" in requirement.lower()
+    return _search_github_host(requirement) is not None
 
 
 def convert_requirements(
@@ -173,7 +239,9 @@ def convert_requirements(
     Returns:
         Tuple of (dependencies list, uv_sources dict)
     """
-    logger = Logger(name="UVMigrator")
+    if not requirements:
+        return [], {}
+    
     dependencies: list[str] = []
     uv_sources: dict[str, dict[str, str]] = {}
     
@@ -182,13 +250,13 @@ def convert_requirements(
         if not req:
             continue
             
-        if is_github_url(req):
+        if _search_github_host(req) is not None:  # is_github_url, inlined
             try:
                 package_name = github_url_to_package_name(req)
                 dependencies.append(package_name)
                 uv_sources[package_name] = {"git": req}
             except ValueError as e:
-                logger.warning(f"Skipping malformed GitHub URL: {req} - {e}")
+                _LOGGER.warning(f"Skipping malformed GitHub URL: {req} - {e}")
         else:
             # PyPI package - add as-is to dependencies
             dependencies.append(req)
@@ -201,7 +269,7 @@ def infer_layer(folder: str, module_name: str, init_yaml: dict[str, Any]) -> str
     Infer layer from folder and name.
     
     Priority:
-    1. Explicit layer in init_yaml (if present)
+    1. Explicit non-empty layer in init_yaml
     2. Known dev-only cores override
     3. Default based on folder
     
@@ -213,16 +281,11 @@ def infer_layer(folder: str, module_name: str, init_yaml: dict[str, Any]) -> str
     Returns:
         Layer string: "foundation", "runtime", or "dev"
     """
-    # Check for explicit layer in init.yaml
-    if "layer" in init_yaml:
-        return init_yaml["layer"]
-    
-    # Check for known dev-only cores
-    if module_name in DEV_CORES:
-        return "dev"
-    
-    # Default based on folder
-    return LAYER_DEFAULTS.get(folder, "runtime")
+    return (
+        init_yaml.get("layer")
+        or _DEV_CORE_LAYERS.get(module_name)
+        or LAYER_DEFAULTS.get(folder, "runtime")
+    )
 
 
 def module_name_to_package_name(module_name: str) -> str:
@@ -233,40 +296,85 @@ def module_name_to_package_name(module_name: str) -> str:
         session_manager → session-manager
         logger_util → logger-util
     """
-    return module_name.replace("_", "-")
+    return module_name.translate(_UNDERSCORE_TO_HYPHEN)
+
+
+def _locate_init_file(
+    module_dir: str,
+) -> tuple[str, Callable[[str], dict[str, Any]]]:
+    """
+    Pick a module's init file and the parser for it.
+    
+    init.toml wins when present, since tomllib is much cheaper than the YAML
+    parser; otherwise init.yaml, whose parser reports it if missing.
+    """
+    init_toml_path = os.path.join(module_dir, "init.toml")
+    if os.path.exists(init_toml_path):
+        return init_toml_path, parse_init_toml
+    return os.path.join(module_dir, "init.yaml"), parse_init_yaml
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write data to path with raw os.write calls, bypassing file-object buffering."""
+    # 0o666 like open(); the umask decides the mode of a new file
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 def generate_pyproject_toml(
-    module_path: Path,
+    module_path: str | os.PathLike[str],
     dry_run: bool = False,
-) -> str:
+    no_overwrite: bool = False,
+    preparsed: Optional[dict[str, Any]] = None,
+    writer: Optional[TextIO] = None,
+) -> Optional[str]:
     """
-    Generate pyproject.toml for a module from its init.yaml.
+    Generate pyproject.toml for a module from its init.yaml (or init.toml).
     
     Args:
-        module_path: Path to the module directory
+        module_path: Path to the module directory (str or path-like)
         dry_run: If True, don't write file, just return content
+        no_overwrite: If True, return None without parsing anything when
+            pyproject.toml already exists
+        preparsed: Already parsed init file content; skips reading it again
+        writer: Open text stream that stands in for module_path/pyproject.toml;
+            content is streamed into it instead of being built as a string,
+            and reporting the write is left to the caller
         
     Returns:
-        Generated pyproject.toml content
+        Generated pyproject.toml content, or None if it was streamed to
+        writer or skipped by no_overwrite
         
     Raises:
-        FileNotFoundError: If init.yaml doesn't exist
+        FileNotFoundError: If the module has neither init.toml nor init.yaml
     """
-    logger = Logger(name="UVMigrator")
+    # Work on the plain string path; os.path is cheaper than pathlib here
+    module_dir = os.fspath(module_path)
+    pyproject_path = os.path.join(module_dir, "pyproject.toml")
+    
+    if no_overwrite and os.path.exists(pyproject_path):
+        return None
     
-    # Parse init.yaml
-    init_yaml = parse_init_yaml(module_path)
+    # Parse init.toml if the module has one, else init.yaml
+    if preparsed is not None:
+        init_yaml = preparsed
+    else:
+        init_yaml = _locate_init_file(module_dir)[1](module_dir)
     
     # Parse requirements.txt (PyPI deps)
-    pypi_requirements = parse_requirements_txt(module_path)
+    pypi_requirements = parse_requirements_txt(module_dir)
     
     # Extract fields from init.yaml
     version = init_yaml.get("version", "0.0.1")
-    module_name = module_path.name
+    module_name = os.path.basename(module_dir)
     
     # Infer folder from path (e.g., cores, managers, mcps)
-    folder = module_path.parent.name
+    folder = os.path.basename(os.path.dirname(module_dir))
     
     # Check if this is an MCP module (either from folder or explicit flag)
     is_mcp = folder == "mcps" or init_yaml.get("mcp", False)
@@ -279,8 +387,8 @@ def generate_pyproject_toml(
     adhd_requirements = init_yaml.get("requirements", []) or []
     adhd_deps, uv_sources = convert_requirements(adhd_requirements)
     
-    # Merge ADHD deps and PyPI deps
-    all_dependencies = adhd_deps + pypi_requirements
+    # Merge ADHD deps and PyPI deps, dropping repeats but keeping first-seen order
+    all_dependencies = list(dict.fromkeys(adhd_deps + pypi_requirements))
     
     # Infer layer
     layer = infer_layer(folder, module_name, init_yaml)
@@ -288,8 +396,7 @@ def generate_pyproject_toml(
     # Generate package name
     package_name = module_name_to_package_name(module_name)
     
-    # Generate content
-    content = generate_pyproject_content(
+    fields = dict(
         name=package_name,
         version=version,
         description=description,
@@ -300,10 +407,16 @@ def generate_pyproject_toml(
         is_mcp=is_mcp,
     )
     
+    # Stream straight into the caller's file; nothing is kept in memory
+    if writer is not None and not dry_run:
+        write_pyproject_content(writer, **fields)
+        return None
+    
+    # Generate content
+    content = generate_pyproject_content(**fields)
+    
     if not dry_run:
-        pyproject_path = module_path / "pyproject.toml"
-        with open(pyproject_path, "w", encoding="utf-8") as f:
-            f.write(content)
-        logger.info(f"Generated {pyproject_path}")
+        _write_bytes(pyproject_path, content.encode("utf-8"))
+        _LOGGER.info(f"Generated {pyproject_path}")
     
     return content
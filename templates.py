@@ -6,48 +6,43 @@ generating uv-compatible pyproject.toml files from init.yaml.
 
 from __future__ import annotations
 
-from typing import Any
+import io
+import re
+from typing import Any, TextIO
 
-# Template parts for pyproject.toml
-PROJECT_HEADER = '''[project]
-name = "{name}"
-version = "{version}"
-description = "{description}"
-requires-python = ">=3.11"
-'''
+# Characters that must be escaped inside a TOML basic string: quote, backslash
+# and every control character (U+0000-U+001F, U+007F), short forms where TOML
+# has them and \uXXXX otherwise
+_TOML_ESCAPES = str.maketrans({
+    **{chr(c): f"\\u{c:04X}" for c in (*range(0x20), 0x7F)},
+    "\\": "\\\\",
+    '"': '\\"',
+    "\b": "\\b",
+    "\t": "\\t",
+    "\n": "\\n",
+    "\f": "\\f",
+    "\r": "\\r",
+})
 
-DEPENDENCIES_SECTION = '''dependencies = [
-{deps}]
-'''
+# Keys matching this can be written bare; anything else must be quoted
+_TOML_BARE_KEY_RE = re.compile(r"[A-Za-z0-9_-]+")
 
-TOOL_ADHD_SECTION = '''
-[tool.adhd]
-layer = "{layer}"
-'''
 
-UV_SOURCES_SECTION = '''
-[tool.uv.sources]
-{sources}'''
+def toml_string(value: Any) -> str:
+    """Render a value as a quoted TOML basic string."""
+    return '"' + str(value).translate(_TOML_ESCAPES) + '"'
 
-BUILD_SYSTEM = '''
-[build-system]
-requires = ["hatchling"]
-build-backend = "hatchling.build"
 
-[tool.hatch.build.targets.wheel]
-only-include = ["."]
-
-[tool.hatch.build.targets.wheel.sources]
-"" = "{module_name}"
-'''
+def toml_key(key: str) -> str:
+    """Render a table key, quoting it unless it is a valid bare key."""
+    return key if _TOML_BARE_KEY_RE.fullmatch(key) else toml_string(key)
 
 
 def format_dependencies(deps: list[str]) -> str:
     """Format dependency list for pyproject.toml."""
     if not deps:
         return ""
-    lines = [f'    "{dep}",' for dep in deps]
-    return "\n".join(lines) + "\n"
+    return "".join("    " + toml_string(dep) + ",\n" for dep in deps)
 
 
 def format_uv_sources(sources: dict[str, dict[str, str]]) -> str:
@@ -58,14 +53,14 @@ def format_uv_sources(sources: dict[str, dict[str, str]]) -> str:
     """
     if not sources:
         return ""
-    lines = []
-    for package_name, source_info in sources.items():
-        # Use workspace = true for local development
-        lines.append(f'{package_name} = {{ workspace = true }}')
-    return "\n".join(lines)
+    # Use workspace = true for local development
+    return "\n".join(
+        toml_key(package_name) + " = { workspace = true }" for package_name in sources
+    )
 
 
-def generate_pyproject_content(
+def write_pyproject_content(
+    out: TextIO,
     name: str,
     version: str,
     description: str,
@@ -74,11 +69,14 @@ def generate_pyproject_content(
     uv_sources: dict[str, dict[str, str]],
     module_name: str,
     is_mcp: bool = False,
-) -> str:
+) -> None:
     """
-    Generate complete pyproject.toml content.
+    Write complete pyproject.toml content to a text stream.
+    
+    Each TOML section is handed to the stream in a single write() call.
     
     Args:
+        out: Stream to write to (a file, or a StringIO to collect a string)
         name: Package name (hyphenated)
         version: Version string
         description: Package description
@@ -87,45 +85,72 @@ def generate_pyproject_content(
         uv_sources: Dict of ADHD packages to their git sources
         module_name: Module name (underscored) for wheel sources mapping
         is_mcp: Whether this is an MCP server module
-        
-    Returns:
-        Complete pyproject.toml content as string
     """
-    content_parts = []
-    
     # Project header
-    content_parts.append(
-        PROJECT_HEADER.format(
-            name=name,
-            version=version,
-            description=description,
-        )
+    out.write(
+        '[project]\n'
+        f'name = {toml_string(name)}\n'
+        f'version = {toml_string(version)}\n'
+        f'description = {toml_string(description)}\n'
+        'requires-python = ">=3.11"\n'
     )
     
     # Dependencies section
     if dependencies:
-        content_parts.append(
-            DEPENDENCIES_SECTION.format(deps=format_dependencies(dependencies))
-        )
+        out.write('dependencies = [\n' + format_dependencies(dependencies) + ']\n')
     else:
-        content_parts.append('dependencies = []\n')
+        out.write('dependencies = []\n')
     
     # Tool.adhd section
-    tool_adhd = TOOL_ADHD_SECTION.format(layer=layer)
-    if is_mcp:
-        # Add mcp = true before the closing newline
-        tool_adhd = tool_adhd.rstrip('\n') + 'mcp = true\n'
-    content_parts.append(tool_adhd)
+    out.write(
+        f'\n[tool.adhd]\nlayer = {toml_string(layer)}\n'
+        + ('mcp = true\n' if is_mcp else '')
+    )
     
     # UV sources section (only if there are ADHD dependencies)
     if uv_sources:
-        content_parts.append(
-            UV_SOURCES_SECTION.format(sources=format_uv_sources(uv_sources))
-        )
+        out.write('\n[tool.uv.sources]\n' + format_uv_sources(uv_sources) + '\n')
     
     # Build system with sources mapping
-    content_parts.append(
-        BUILD_SYSTEM.format(module_name=module_name)
+    out.write(
+        '\n[build-system]\n'
+        'requires = ["hatchling"]\n'
+        'build-backend = "hatchling.build"\n'
+        '\n[tool.hatch.build.targets.wheel]\n'
+        'only-include = ["."]\n'
+        '\n[tool.hatch.build.targets.wheel.sources]\n'
+        f'"" = {toml_string(module_name)}\n'
     )
+
+
+def generate_pyproject_content(
+    name: str,
+    version: str,
+    description: str,
+    layer: str,
+    dependencies: list[str],
+    uv_sources: dict[str, dict[str, str]],
+    module_name: str,
+    is_mcp: bool = False,
+) -> str:
+    """
+    Generate complete pyproject.toml content.
     
-    return "".join(content_parts)
+    Same arguments as write_pyproject_content, minus the stream.
+    
+    Returns:
+        Complete pyproject.toml content as string
+    """
+    buf = io.StringIO()
+    write_pyproject_content(
+        buf,
+        name=name,
+        version=version,
+        description=description,
+        layer=layer,
+        dependencies=dependencies,
+        uv_sources=uv_sources,
+        module_name=module_name,
+        is_mcp=is_mcp,
+    )
+    return buf.getvalue()
@@ -0,0 +1,439 @@
+"""Unit tests for UVMigratorCore."""
+
+from __future__ import annotations
+
+import os
+import stat
+import tomllib
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from uv_migrator_core import UVMigratorCore, migrator
+from uv_migrator_core.migrator import (
+    generate_pyproject_toml,
+    github_url_to_package_name,
+    infer_layer,
+    is_github_url,
+)
+from uv_migrator_core.templates import generate_pyproject_content, toml_key, toml_string
+from uv_migrator_core.uv_migrator_core import _load_init_cached
+
+
+class _FixedModules:
+    """Stands in for ModulesController, returning a fixed discovery list."""
+
+    def __init__(self, modules: list[SimpleNamespace]):
+        self.modules = modules
+
+    def discover_modules(self) -> list[SimpleNamespace]:
+        return self.modules
+
+
+def _make_module(
+    root: Path, rel_path: str, init_yaml: str = "version: 0.1.0\n"
+) -> SimpleNamespace:
+    """Create a module directory with an init.yaml and return its ModuleInfo."""
+    module_dir = root / rel_path
+    module_dir.mkdir(parents=True)
+    (module_dir / "init.yaml").write_text(init_yaml, encoding="utf-8")
+    folder, name = rel_path.split("/")
+    return SimpleNamespace(name=name, path=rel_path, folder=folder)
+
+
+@pytest.fixture
+def duplicate_tree(tmp_path: Path) -> tuple[UVMigratorCore, list[SimpleNamespace]]:
+    """Two same-named modules (one already migrated), a broken one and an MCP."""
+    modules = [
+        _make_module(tmp_path, "cores/foo_core"),
+        _make_module(tmp_path, "managers/foo_core"),
+        _make_module(tmp_path, "utils/empty", init_yaml=": : bad\n"),
+        _make_module(tmp_path, "mcps/x_mcp"),
+    ]
+    existing = tmp_path / "cores/foo_core/pyproject.toml"
+    existing.write_text("[project]\n", encoding="utf-8")
+
+    migrator = UVMigratorCore(tmp_path)
+    migrator._modules_controller = _FixedModules(modules)
+    return migrator, modules
+
+
+def test_migrate_all_no_overwrite_keeps_results_aligned(duplicate_tree):
+    """A skip for one module must not skip, or shift results past, a same-named one."""
+    migrator, modules = duplicate_tree
+
+    report = migrator.migrate_all(no_overwrite=True)
+
+    root = migrator.root_path
+    assert [r.output_path for r in report.results] == [
+        root / "cores/foo_core/pyproject.toml",
+        root / "managers/foo_core/pyproject.toml",
+        None,
+        root / "mcps/x_mcp/pyproject.toml",
+    ]
+    assert [r.module_name for r in report.results] == [m.name for m in modules]
+    assert report.results[0].message == "Skipped (pyproject.toml exists)"
+    assert report.results[1].message == "Generated pyproject.toml"
+    assert not report.results[2].success
+    assert report.results[3].message == "Generated pyproject.toml"
+
+    assert (root / "cores/foo_core/pyproject.toml").read_text() == "[project]\n"
+    manager_toml = (root / "managers/foo_core/pyproject.toml").read_text()
+    assert 'name = "foo-core"' in manager_toml
+    assert 'name = "x-mcp"' in (root / "mcps/x_mcp/pyproject.toml").read_text()
+
+
+def test_find_module_returns_first_of_duplicate_names(duplicate_tree):
+    migrator, modules = duplicate_tree
+
+    assert migrator._find_module("foo_core") is modules[0]
+
+
+def test_dry_run_writes_nothing(duplicate_tree, tmp_path):
+    migrator, _ = duplicate_tree
+    before = sorted(tmp_path.rglob("*"))
+
+    report = migrator.migrate_all(dry_run=True)
+
+    assert sorted(tmp_path.rglob("*")) == before
+    assert report.results[1].content is not None
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://github.com/org/Logger-Util.git", "logger-util"),
+        ("https://GitHub.com/org/Logger-Util.git", "logger-util"),
+        ("git+https://GITHUB.COM/org/session_manager", "session-manager"),
+    ],
+)
+def test_github_url_to_package_name_ignores_host_case(url, expected):
+    assert is_github_url(url)
+    assert github_url_to_package_name(url) == expected
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://github.com/org/repo/", "repo"),
+        ("https://github.com/org/repo.git?ref=v1#readme", "repo"),
+    ],
+)
+def test_github_url_to_package_name_tolerates_suffixes(url, expected):
+    assert github_url_to_package_name(url) == expected
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://github.com/org/repo//",
+        "https://github.com/org",
+        "https://github.com/",
+    ],
+)
+def test_github_url_to_package_name_rejects_incomplete_urls(url):
+    with pytest.raises(ValueError, match="Not a valid GitHub repository URL"):
+        github_url_to_package_name(url)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "plain",
+        'quote " and \\ backslash',
+        "tab\tnew\nline\r",
+        "\x00\x08\x0c\x1b\x7f",
+        "é",
+    ],
+)
+def test_toml_string_round_trips(value):
+    assert tomllib.loads(f"key = {toml_string(value)}")["key"] == value
+
+
+def test_toml_key_quotes_only_when_needed():
+    assert toml_key("logger-util") == "logger-util"
+    assert toml_key("my.pkg") == '"my.pkg"'
+    assert tomllib.loads(f"{toml_key('my.pkg')} = 1") == {"my.pkg": 1}
+
+
+def test_generated_content_is_valid_toml_with_awkward_values():
+    content = generate_pyproject_content(
+        name="odd-pkg",
+        version='1.0"beta',
+        description="ADHD Framework core: odd_pkg",
+        layer="runtime",
+        dependencies=["a", "b\\c"],
+        uv_sources={"my.dep": {"git": "https://github.com/org/my.dep.git"}},
+        module_name="odd_pkg",
+        is_mcp=True,
+    )
+
+    data = tomllib.loads(content)
+    assert data["project"]["version"] == '1.0"beta'
+    assert data["project"]["dependencies"] == ["a", "b\\c"]
+    assert data["tool"]["adhd"] == {"layer": "runtime", "mcp": True}
+    assert data["tool"]["uv"]["sources"] == {"my.dep": {"workspace": True}}
+
+
+@pytest.mark.parametrize(
+    ("folder", "module_name", "init_yaml", "expected"),
+    [
+        ("managers", "session_manager", {"layer": "foundation"}, "foundation"),
+        ("managers", "session_manager", {"layer": ""}, "runtime"),
+        ("managers", "session_manager", {"layer": None}, "runtime"),
+        ("cores", "uv_migrator_core", {"layer": ""}, "dev"),
+        ("cores", "yaml_reading_core", {}, "foundation"),
+        ("unknown", "thing", {}, "runtime"),
+    ],
+)
+def test_infer_layer(folder, module_name, init_yaml, expected):
+    """An explicit layer wins; an empty one falls through to inference."""
+    assert infer_layer(folder, module_name, init_yaml) == expected
+
+
+@pytest.mark.parametrize("umask", [0o002, 0o022, 0o077])
+def test_generate_pyproject_toml_new_file_mode_follows_umask(tmp_path, umask):
+    _make_module(tmp_path, "utils/mode_util")
+    module_dir = tmp_path / "utils/mode_util"
+
+    old_umask = os.umask(umask)
+    try:
+        generate_pyproject_toml(module_dir)
+    finally:
+        os.umask(old_umask)
+
+    mode = stat.S_IMODE((module_dir / "pyproject.toml").stat().st_mode)
+    assert mode == 0o666 & ~umask
+
+
+def test_generate_pyproject_toml_deduplicates_dependencies(tmp_path):
+    _make_module(
+        tmp_path,
+        "managers/dedup_manager",
+        init_yaml=(
+            "version: 0.2.0\n"
+            "requirements:\n"
+            "  - https://github.com/org/Logger-Util.git\n"
+            "  - https://github.com/org/logger_util.git\n"
+        ),
+    )
+    module_dir = tmp_path / "managers/dedup_manager"
+    (module_dir / "requirements.txt").write_text(
+        "pyyaml>=6.0\nlogger-util\npyyaml>=6.0\n", encoding="utf-8"
+    )
+
+    content = generate_pyproject_toml(module_dir, dry_run=True)
+
+    dependencies = tomllib.loads(content)["project"]["dependencies"]
+    assert dependencies == ["logger-util", "pyyaml>=6.0"]
+    assert not (module_dir / "pyproject.toml").exists()
+
+
+def test_generate_pyproject_toml_reads_init_toml(tmp_path):
+    module_dir = tmp_path / "managers/toml_manager"
+    module_dir.mkdir(parents=True)
+    (module_dir / "init.toml").write_text(
+        'version = "1.2.3"\n'
+        'layer = "foundation"\n'
+        'requirements = ["https://github.com/org/Logger-Util.git"]\n',
+        encoding="utf-8",
+    )
+
+    data = tomllib.loads(generate_pyproject_toml(module_dir, dry_run=True))
+
+    assert data["project"]["version"] == "1.2.3"
+    assert data["project"]["dependencies"] == ["logger-util"]
+    assert data["tool"]["adhd"]["layer"] == "foundation"
+
+
+def test_generate_pyproject_toml_prefers_init_toml(tmp_path):
+    _make_module(tmp_path, "utils/both_util", init_yaml="version: 0.0.9\n")
+    module_dir = tmp_path / "utils/both_util"
+    (module_dir / "init.toml").write_text('version = "2.0.0"\n', encoding="utf-8")
+
+    data = tomllib.loads(generate_pyproject_toml(module_dir, dry_run=True))
+
+    assert data["project"]["version"] == "2.0.0"
+
+
+def test_generate_pyproject_toml_without_init_file(tmp_path):
+    module_dir = tmp_path / "utils/bare_util"
+    module_dir.mkdir(parents=True)
+
+    with pytest.raises(FileNotFoundError, match="init.yaml"):
+        generate_pyproject_toml(module_dir, dry_run=True)
+
+
+@pytest.fixture
+def cached_migrator(tmp_path: Path) -> UVMigratorCore:
+    """A migrator with a disk cache and one module, utils/cached_util."""
+    _make_module(tmp_path, "utils/cached_util")
+    return UVMigratorCore(tmp_path, cache_dir=tmp_path / "cache")
+
+
+def _fail_parse(module_path):
+    raise AssertionError(f"init file parsed for {module_path}")
+
+
+def test_init_cache_hit_skips_parsing(cached_migrator, monkeypatch):
+    assert cached_migrator.migrate_module("utils/cached_util").success
+    assert len(list(cached_migrator.cache_dir.glob("*.json"))) == 1
+
+    monkeypatch.setattr(migrator, "parse_init_yaml", _fail_parse)
+    result = cached_migrator.migrate_module("utils/cached_util", dry_run=True)
+
+    assert result.success
+    assert 'version = "0.1.0"' in result.content
+
+
+def test_init_cache_misses_after_edit(cached_migrator, monkeypatch):
+    cached_migrator.migrate_module("utils/cached_util")
+    init_yaml = cached_migrator.root_path / "utils/cached_util/init.yaml"
+    init_yaml.write_text("version: 0.1.10\n", encoding="utf-8")
+
+    monkeypatch.setattr(migrator, "parse_init_yaml", _fail_parse)
+    result = cached_migrator.migrate_module("utils/cached_util", dry_run=True)
+
+    assert not result.success
+    assert "init file parsed" in result.message
+
+
+def test_dry_run_does_not_write_init_cache(cached_migrator):
+    result = cached_migrator.migrate_module("utils/cached_util", dry_run=True)
+
+    assert result.success
+    assert not cached_migrator.cache_dir.exists()
+    assert not (cached_migrator.root_path / "utils/cached_util/pyproject.toml").exists()
+
+
+def test_init_cache_skips_data_json_would_change(tmp_path):
+    _make_module(
+        tmp_path, "utils/keyed_util", init_yaml="version: 0.1.0\nextra: {1: a}\n"
+    )
+    cache_dir = tmp_path / "cache"
+    module_dir = os.fspath(tmp_path / "utils/keyed_util")
+
+    first = _load_init_cached(module_dir, cache_dir)
+    second = _load_init_cached(module_dir, cache_dir)
+
+    assert first["extra"] == second["extra"] == {1: "a"}
+    assert list(cache_dir.glob("*.json")) == []
+
+
+def test_no_cache_dir_by_default(tmp_path):
+    _make_module(tmp_path, "utils/plain_util")
+    migrator_core = UVMigratorCore(tmp_path)
+
+    assert migrator_core.migrate_module("utils/plain_util").success
+    assert migrator_core.cache_dir is None
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["utils"]
+
+
+@pytest.fixture
+def write_module(tmp_path: Path) -> tuple[UVMigratorCore, Path]:
+    """A migrator and the directory of its one module, utils/write_util."""
+    _make_module(tmp_path, "utils/write_util")
+    return UVMigratorCore(tmp_path), tmp_path / "utils/write_util"
+
+
+def test_write_keeps_existing_file_mode(write_module):
+    migrator_core, module_dir = write_module
+    pyproject = module_dir / "pyproject.toml"
+    pyproject.write_text("old\n", encoding="utf-8")
+    pyproject.chmod(0o600)
+
+    assert migrator_core.migrate_module("utils/write_util").success
+
+    assert stat.S_IMODE(pyproject.stat().st_mode) == 0o600
+    assert pyproject.read_text().startswith("[project]")
+
+
+def test_write_new_file_mode_follows_umask(write_module):
+    migrator_core, module_dir = write_module
+
+    old_umask = os.umask(0o027)
+    try:
+        assert migrator_core.migrate_module("utils/write_util").success
+    finally:
+        os.umask(old_umask)
+
+    assert stat.S_IMODE((module_dir / "pyproject.toml").stat().st_mode) == 0o640
+
+
+def test_write_through_symlinked_pyproject(write_module, tmp_path):
+    migrator_core, module_dir = write_module
+    real = tmp_path / "shared.toml"
+    real.write_text("old\n", encoding="utf-8")
+    (module_dir / "pyproject.toml").symlink_to(real)
+
+    assert migrator_core.migrate_module("utils/write_util").success
+
+    assert (module_dir / "pyproject.toml").is_symlink()
+    assert real.read_text().startswith("[project]")
+
+
+def test_failed_write_leaves_no_temp_file(write_module, monkeypatch):
+    migrator_core, module_dir = write_module
+    pyproject = module_dir / "pyproject.toml"
+    pyproject.write_text("old\n", encoding="utf-8")
+
+    def fail(out, **fields):
+        out.write("partial")
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(migrator, "write_pyproject_content", fail)
+    result = migrator_core.migrate_module("utils/write_util")
+
+    assert not result.success
+    assert pyproject.read_text() == "old\n"
+    remaining = sorted(p.name for p in module_dir.iterdir())
+    assert remaining == ["init.yaml", "pyproject.toml"]
+
+
+class _NoDiscovery:
+    """Fails the test if module discovery is attempted."""
+
+    def discover_modules(self):
+        raise AssertionError("module discovery should not run")
+
+
+@pytest.fixture
+def path_migrator(tmp_path: Path) -> UVMigratorCore:
+    """A migrator for a tree with managers/path_manager that cannot discover."""
+    _make_module(tmp_path, "managers/path_manager")
+    migrator_core = UVMigratorCore(tmp_path)
+    migrator_core._modules_controller = _NoDiscovery()
+    return migrator_core
+
+
+def test_migrate_module_by_path_skips_discovery(path_migrator):
+    result = path_migrator.migrate_module("managers/path_manager", dry_run=True)
+
+    assert result.success
+    assert result.module_name == "path_manager"
+    assert result.output_path == (
+        path_migrator.root_path / "managers/path_manager/pyproject.toml"
+    )
+    data = tomllib.loads(result.content)
+    assert data["project"]["name"] == "path-manager"
+    assert data["tool"]["adhd"]["layer"] == "runtime"
+
+
+def test_migrate_module_by_path_no_overwrite(path_migrator):
+    pyproject = path_migrator.root_path / "managers/path_manager/pyproject.toml"
+    pyproject.write_text("[project]\n", encoding="utf-8")
+
+    result = path_migrator.migrate_module("managers/path_manager", no_overwrite=True)
+
+    assert result.success
+    assert result.message == "Skipped (pyproject.toml exists)"
+    assert pyproject.read_text() == "[project]\n"
+
+
+def test_migrate_module_by_missing_path(path_migrator):
+    result = path_migrator.migrate_module("managers/missing_manager")
+
+    assert not result.success
+    assert result.module_name == "managers/missing_manager"
+    assert "not found" in result.message
@@ -17,6 +17,14 @@ from logger_util import Logger
 from .uv_migrator_core import UVMigratorCore
 
 
+# `adhd migrate` flags mapped to the migrate_command keyword they enable
+_FLAGS: dict[str, str] = {
+    "--all": "all_modules",
+    "--dry-run": "dry_run",
+    "--no-overwrite": "no_overwrite",
+}
+
+
 def migrate_command(
     module_name: Optional[str] = None,
     all_modules: bool = False,
@@ -106,29 +114,16 @@ def main(args: Optional[list[str]] = None) -> None:
 def _cli_migrate_handler(args: list[str]) -> None:
     """CLI handler that parses args and calls migrate_command."""
     module_name: Optional[str] = None
-    all_modules = False
-    dry_run = False
-    no_overwrite = False
+    flags = dict.fromkeys(_FLAGS.values(), False)
     
-    i = 0
-    while i < len(args):
-        arg = args[i]
-        if arg == "--all":
-            all_modules = True
-        elif arg == "--dry-run":
-            dry_run = True
-        elif arg == "--no-overwrite":
-            no_overwrite = True
+    for arg in args:
+        flag = _FLAGS.get(arg)
+        if flag is not None:
+            flags[flag] = True
         elif not arg.startswith("--"):
             module_name = arg
-        i += 1
     
-    migrate_command(
-        module_name=module_name,
-        all_modules=all_modules,
-        dry_run=dry_run,
-        no_overwrite=no_overwrite,
-    )
+    migrate_command(module_name=module_name, **flags)
 
 
 if __name__ == "__main__":
@@ -7,26 +7,52 @@ from init.yaml format to pyproject.toml format compatible with uv workspaces.
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import hashlib
+import json
+import os
+import secrets
+import stat
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 from dataclasses import dataclass, field
+from enum import IntEnum
 
 from logger_util import Logger
-from modules_controller_core.modules_controller import ModulesController, ModuleInfo
-from .migrator import generate_pyproject_toml
 
+# ModulesController and the migrator (PyYAML) are imported where first used,
+# so importing this module, e.g. for `adhd migrate --help`, stays cheap
+if TYPE_CHECKING:
+    from modules_controller_core.modules_controller import ModuleInfo
 
-@dataclass
+
+# MigrationResult.message for a module whose pyproject.toml was written
+_GENERATED_MESSAGE = "Generated pyproject.toml"
+
+# Write buffer for streamed pyproject.toml output; holds any realistic file,
+# so each module's output still reaches the OS in one write
+_WRITE_BUFFER_SIZE = 128 * 1024
+
+# How many modules past those the worker pool is already reading to prefetch
+# init files for
+_PREFETCH_DISTANCE = 4
+
+
+@dataclass(slots=True)
 class MigrationResult:
     """Result of a single module migration."""
     module_name: str
     success: bool
     message: str
     output_path: Optional[Path] = None
-    content: Optional[str] = None
+    content: Optional[str] = None  # Dry runs only; real migrations leave it None
 
 
-@dataclass 
+@dataclass(slots=True)
 class MigrationReport:
     """Summary report of migration operation."""
     results: list[MigrationResult] = field(default_factory=list)
@@ -41,18 +67,256 @@ class MigrationReport:
     
     def print_summary(self, logger: Logger) -> None:
         """Print migration summary."""
+        # Count and collect failures in one pass over the results
+        failed = [r for r in self.results if not r.success]
         total = len(self.results)
-        success_count = len(self.successful)
-        fail_count = len(self.failed)
         
-        logger.info(f"Migration complete: {success_count}/{total} successful")
+        logger.info(f"Migration complete: {total - len(failed)}/{total} successful")
         
-        if self.failed:
-            logger.warning(f"{fail_count} modules had issues:")
-            for result in self.failed:
+        if failed:
+            logger.warning(f"{len(failed)} modules had issues:")
+            for result in failed:
                 logger.warning(f"  - {result.module_name}: {result.message}")
 
 
+def _prefetch_file(path: str) -> None:
+    """
+    Ask the kernel to start reading path into the page cache.
+    
+    Non-blocking hint; a no-op where posix_fadvise is unavailable or the
+    file cannot be opened (the migration itself reports missing files).
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _load_init_cached(
+    module_path: str,
+    cache_dir: Optional[Path],
+    update: bool = True,
+) -> dict[str, Any]:
+    """
+    Parse a module's init file, reusing a JSON copy from cache_dir if fresh.
+    
+    Entries are keyed by path, mtime and size, so an edited init file simply
+    misses. Unreadable entries are ignored, and data JSON cannot hold or
+    would not read back unchanged (e.g. non-string keys) is just not cached,
+    so the cache never changes what gets parsed. With
+    cache_dir None there is no cache, and with update False it is only
+    read, never written.
+    """
+    from .migrator import _locate_init_file
+    
+    init_path, parse_init = _locate_init_file(module_path)
+    if cache_dir is None:
+        return parse_init(module_path)
+    
+    try:
+        st = os.stat(init_path)
+    except FileNotFoundError:
+        return parse_init(module_path)  # Raises with the usual message
+    
+    key = f"{init_path}:{st.st_mtime_ns}:{st.st_size}".encode()
+    cache_file = cache_dir / f"{hashlib.blake2b(key).hexdigest()[:16]}.json"
+    
+    try:
+        data = json.loads(cache_file.read_bytes())
+        if isinstance(data, dict):
+            return data
+    except (OSError, ValueError):
+        pass
+    
+    data = parse_init(module_path)
+    if not update:
+        return data
+    
+    try:
+        payload = json.dumps(data)
+        if json.loads(payload) != data:
+            return data
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent readers never see a partial entry
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=cache_dir, suffix=".tmp", delete=False
+        ) as f:
+            f.write(payload)
+        os.replace(f.name, cache_file)
+    except (OSError, TypeError, ValueError):
+        pass
+    
+    return data
+
+
+class _Action(IntEnum):
+    """What to do with a module; resolved once per run, not per module."""
+    SKIP = 0
+    DRY = 1
+    WRITE = 2
+
+
+def _skipped_result(module_name: str, pyproject_path: str) -> MigrationResult:
+    """Result for a module left alone because pyproject.toml already exists."""
+    return MigrationResult(
+        module_name=module_name,
+        success=True,
+        message="Skipped (pyproject.toml exists)",
+        output_path=Path(pyproject_path),
+    )
+
+
+def _do_skip(
+    module_name: str, module_path: str, cache_dir: Optional[Path]
+) -> MigrationResult:
+    """_Action.SKIP: report the existing pyproject.toml untouched."""
+    return _skipped_result(module_name, os.path.join(module_path, "pyproject.toml"))
+
+
+def _do_dry(
+    module_name: str, module_path: str, cache_dir: Optional[Path]
+) -> MigrationResult:
+    """_Action.DRY: generate content without writing it (nor the cache)."""
+    from .migrator import generate_pyproject_toml
+    
+    init_data = _load_init_cached(module_path, cache_dir, update=False)
+    content = generate_pyproject_toml(module_path, dry_run=True, preparsed=init_data)
+    return MigrationResult(
+        module_name=module_name,
+        success=True,
+        message="Dry run - preview only",
+        output_path=Path(os.path.join(module_path, "pyproject.toml")),
+        content=content,
+    )
+
+
+def _create_temp_beside(target: str) -> tuple[int, str]:
+    """
+    Create a uniquely named file next to target, returning (fd, path).
+    
+    Like tempfile.mkstemp, but created with mode 0o666 so the umask decides
+    the permissions of a brand-new target, as open() would.
+    """
+    directory, name = os.path.split(target)
+    while True:
+        tmp_path = os.path.join(directory, f".{name}.{secrets.token_hex(4)}.tmp")
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            continue
+        return fd, tmp_path
+
+
+def _do_write(
+    module_name: str, module_path: str, cache_dir: Optional[Path]
+) -> MigrationResult:
+    """_Action.WRITE: stream the generated content into pyproject.toml."""
+    from .migrator import generate_pyproject_toml
+    
+    pyproject_path = os.path.join(module_path, "pyproject.toml")
+    init_data = _load_init_cached(module_path, cache_dir)
+    
+    # Stream into a unique temp file and swap it in, so a failure part-way
+    # never leaves a truncated pyproject.toml behind and concurrent runs
+    # cannot clobber each other's temp file. A symlinked pyproject.toml has
+    # its target replaced, and an existing file keeps its mode and (where
+    # permitted) ownership. Content is not retained; read the file if it is
+    # needed.
+    target = os.path.realpath(pyproject_path)
+    try:
+        existing = os.stat(target)
+    except FileNotFoundError:
+        existing = None
+    
+    fd, tmp_path = _create_temp_beside(target)
+    try:
+        with open(
+            fd, "w", encoding="utf-8", newline="\n",
+            buffering=_WRITE_BUFFER_SIZE,
+        ) as f:
+            if existing is not None:
+                os.chmod(tmp_path, stat.S_IMODE(existing.st_mode))
+                if hasattr(os, "chown"):
+                    with contextlib.suppress(OSError):
+                        os.chown(tmp_path, existing.st_uid, existing.st_gid)
+            generate_pyproject_toml(module_path, preparsed=init_data, writer=f)
+        os.replace(tmp_path, target)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    
+    return MigrationResult(
+        module_name=module_name,
+        success=True,
+        message=_GENERATED_MESSAGE,
+        output_path=Path(pyproject_path),
+    )
+
+
+# Handler per action, indexed by _Action value
+_ACTION_HANDLERS: tuple[
+    Callable[[str, str, Optional[Path]], MigrationResult], ...
+] = (
+    _do_skip,
+    _do_dry,
+    _do_write,
+)
+
+
+def _run_handler(
+    handler: Callable[[str, str, Optional[Path]], MigrationResult],
+    module_name: str,
+    module_path: str,
+    cache_dir: Optional[Path],
+) -> MigrationResult:
+    """Run an action handler, turning failures into a failed MigrationResult."""
+    try:
+        return handler(module_name, module_path, cache_dir)
+    except FileNotFoundError as e:
+        return MigrationResult(
+            module_name=module_name,
+            success=False,
+            message=f"Missing init file: {e}",
+        )
+    except Exception as e:
+        return MigrationResult(
+            module_name=module_name,
+            success=False,
+            message=f"Migration failed: {e}",
+        )
+
+
+def _migrate_path(
+    module_name: str,
+    module_path: str,
+    dry_run: bool,
+    no_overwrite: bool,
+    cache_dir: Optional[Path],
+) -> MigrationResult:
+    """
+    Migrate the module at module_path.
+    
+    Free of controller state, so it is safe to run from worker threads.
+    Paths stay plain strings until a result needs a Path.
+    """
+    action = _Action.DRY if dry_run else _Action.WRITE
+    
+    # Check for existing pyproject.toml before any parsing
+    if no_overwrite and os.path.exists(os.path.join(module_path, "pyproject.toml")):
+        action = _Action.SKIP
+    
+    return _run_handler(_ACTION_HANDLERS[action], module_name, module_path, cache_dir)
+
+
 class UVMigratorCore:
     """
     Controller for migrating ADHD modules to pyproject.toml format.
@@ -63,16 +327,32 @@ class UVMigratorCore:
     - Dry-run preview mode
     """
     
-    def __init__(self, root_path: Optional[Path] = None):
+    def __init__(
+        self,
+        root_path: Optional[Path] = None,
+        cache_dir: Optional[Path] = None,
+    ):
         """
         Initialize the migrator.
         
         Args:
             root_path: Project root path. Defaults to cwd.
+            cache_dir: Directory to cache parsed init files in between runs.
+                Defaults to None (no cache). Dry runs only read it.
         """
         self.root_path = (root_path or Path.cwd()).resolve()
+        self.cache_dir = cache_dir
+        # String form for os.path joins on the per-module hot path
+        self._root_str = os.fspath(self.root_path)
         self.logger = Logger(name="UVMigratorCore")
+        
+        from modules_controller_core.modules_controller import ModulesController
         self._modules_controller = ModulesController(self.root_path)
+        self._modules_cache: Optional[list[ModuleInfo]] = None
+        self._modules_by_name: Optional[dict[str, ModuleInfo]] = None
+        self._modules_by_prefix: Optional[dict[str, list[ModuleInfo]]] = None
+        # Per-instance memo over the lookup; cleared by invalidate_cache()
+        self._find_module = functools.lru_cache(maxsize=None)(self._find_module_impl)
     
     def migrate_module(
         self,
@@ -84,73 +364,52 @@ class UVMigratorCore:
         Migrate a single module to pyproject.toml format.
         
         Args:
-            module_name: Name of the module to migrate
+            module_name: Name of the module to migrate, or its directory
+                (anything containing a path separator, relative to root_path)
             dry_run: If True, preview without writing
             no_overwrite: If True, skip if pyproject.toml exists
             
         Returns:
             MigrationResult with success status and details
         """
-        # Find the module
-        module_info = self._find_module(module_name)
-        if module_info is None:
-            return MigrationResult(
-                module_name=module_name,
-                success=False,
-                message=f"Module '{module_name}' not found",
-            )
-        
-        module_path = self.root_path / module_info.path
-        pyproject_path = module_path / "pyproject.toml"
-        
-        # Check for existing pyproject.toml
-        if no_overwrite and pyproject_path.exists():
-            return MigrationResult(
-                module_name=module_name,
-                success=True,
-                message="Skipped (pyproject.toml exists)",
-                output_path=pyproject_path,
-            )
-        
-        try:
-            content = generate_pyproject_toml(module_path, dry_run=dry_run)
-            
-            if dry_run:
-                self.logger.info(f"[DRY RUN] Would generate {pyproject_path}")
+        if "/" in module_name or os.sep in module_name:
+            # Explicit path: no need to discover the whole project
+            module_path = os.path.normpath(os.path.join(self._root_str, module_name))
+            if not os.path.isdir(module_path):
                 return MigrationResult(
                     module_name=module_name,
-                    success=True,
-                    message="Dry run - preview only",
-                    output_path=pyproject_path,
-                    content=content,
+                    success=False,
+                    message=f"Module directory '{module_path}' not found",
                 )
-            else:
+            result = _migrate_path(
+                os.path.basename(module_path),
+                module_path,
+                dry_run,
+                no_overwrite,
+                self.cache_dir,
+            )
+        else:
+            # Find the module
+            module_info = self._find_module(module_name)
+            if module_info is None:
                 return MigrationResult(
                     module_name=module_name,
-                    success=True,
-                    message="Generated pyproject.toml",
-                    output_path=pyproject_path,
-                    content=content,
+                    success=False,
+                    message=f"Module '{module_name}' not found",
                 )
-                
-        except FileNotFoundError as e:
-            return MigrationResult(
-                module_name=module_name,
-                success=False,
-                message=f"Missing init.yaml: {e}",
-            )
-        except Exception as e:
-            return MigrationResult(
-                module_name=module_name,
-                success=False,
-                message=f"Migration failed: {e}",
-            )
+            result = self._migrate_module_info(module_info, dry_run, no_overwrite)
+        
+        log_line = self._result_log_line(result, dry_run)
+        if log_line is not None:
+            self.logger.info(log_line)
+        return result
     
     def migrate_all(
         self,
         dry_run: bool = False,
         no_overwrite: bool = False,
         include_cores: bool = True,
+        max_workers: Optional[int] = None,
     ) -> MigrationReport:
         """
         Migrate all discovered modules.
@@ -159,37 +418,151 @@ class UVMigratorCore:
             dry_run: If True, preview without writing
             no_overwrite: If True, skip modules with existing pyproject.toml
             include_cores: If True, include core modules
+            max_workers: Thread pool size; None uses the executor default
             
         Returns:
             MigrationReport with results for all modules
         """
-        report = MigrationReport()
-        
-        # Get all modules
-        modules = self._modules_controller.discover_modules()
-        
-        for module in modules:
-            # Optionally skip cores
+        # One pass over the cached discovery list: cores are dropped before any
+        # per-module work, and no_overwrite skips are settled up front so
+        # already-migrated modules never reach the workers. Skips are recorded
+        # per candidate, not per name, as module names need not be unique.
+        candidates: list[ModuleInfo] = []
+        skipped: list[bool] = []
+        modules: list[ModuleInfo] = []
+        for module in self._get_modules():
             if not include_cores and module.folder == "cores":
                 continue
-            
-            result = self.migrate_module(
-                module_name=module.name,
-                dry_run=dry_run,
-                no_overwrite=no_overwrite,
+            skip = no_overwrite and os.path.exists(
+                os.path.join(self._root_str, module.path, "pyproject.toml")
+            )
+            candidates.append(module)
+            skipped.append(skip)
+            if not skip:
+                modules.append(module)
+        
+        from .migrator import _locate_init_file
+        
+        # dry_run is fixed for the whole run, so pick the handler once
+        handler = _ACTION_HANDLERS[_Action.DRY if dry_run else _Action.WRITE]
+        module_dirs = [os.path.join(self._root_str, module.path) for module in modules]
+        
+        # Same size ThreadPoolExecutor picks when max_workers is None
+        workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        
+        # map() submits every task at once, so the first `workers` modules are
+        # read straight away and hinting them is wasted work. Instead each
+        # migration hints the init file (whichever one will be parsed) of the
+        # module _PREFETCH_DISTANCE places past the pool's current window, so
+        # it is warm by the time a worker reaches it. Nothing is hinted when
+        # the pool covers every module or posix_fadvise is unavailable.
+        lookahead = workers + _PREFETCH_DISTANCE
+        prefetch = hasattr(os, "posix_fadvise") and len(module_dirs) > workers
+        if prefetch:
+            for module_dir in module_dirs[workers:lookahead]:
+                _prefetch_file(_locate_init_file(module_dir)[0])
+        
+        def migrate(index: int) -> MigrationResult:
+            ahead = index + lookahead
+            if prefetch and ahead < len(module_dirs):
+                _prefetch_file(_locate_init_file(module_dirs[ahead])[0])
+            return _run_handler(
+                handler, modules[index].name, module_dirs[index], self.cache_dir
             )
-            report.results.append(result)
+        
+        # Modules are independent and the work is mostly small-file I/O, so
+        # overlap it across threads. map() keeps results in discovery order.
+        # The result count is known up front, so fill a presized list in place
+        results: list[MigrationResult] = [None] * len(candidates)  # type: ignore[list-item]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            migrated = executor.map(migrate, range(len(modules)))
+            for index, (module, skip) in enumerate(zip(candidates, skipped)):
+                if skip:
+                    module_dir = os.path.join(self._root_str, module.path)
+                    results[index] = _do_skip(module.name, module_dir, self.cache_dir)
+                else:
+                    results[index] = next(migrated)
+        
+        report = MigrationReport(results)
+        # One log call for the whole run rather than one per module
+        log_lines = [
+            line
+            for line in (self._result_log_line(r, dry_run) for r in report.results)
+            if line is not None
+        ]
+        if log_lines:
+            self.logger.info("\n".join(log_lines))
         
         return report
     
-    def _find_module(self, module_name: str) -> Optional[ModuleInfo]:
-        """Find a module by name."""
-        modules = self._modules_controller.discover_modules()
-        for module in modules:
-            if module.name == module_name:
-                return module
+    def _migrate_module_info(
+        self,
+        module_info: ModuleInfo,
+        dry_run: bool,
+        no_overwrite: bool,
+    ) -> MigrationResult:
+        """Migrate an already discovered module, skipping the name lookup."""
+        module_path = os.path.join(self._root_str, module_info.path)
+        return _migrate_path(
+            module_info.name, module_path, dry_run, no_overwrite, self.cache_dir
+        )
+    
+    def _result_log_line(self, result: MigrationResult, dry_run: bool) -> Optional[str]:
+        """Per-module log line for a result, or None if there is nothing to say."""
+        if not result.success:
+            return None
+        if dry_run:
+            if result.content is not None:
+                return f"[DRY RUN] Would generate {result.output_path}"
+        elif result.message == _GENERATED_MESSAGE:
+            return f"Generated {result.output_path}"
         return None
     
+    def invalidate_cache(self) -> None:
+        """Forget discovered modules so the next lookup rescans the project."""
+        self._modules_cache = None
+        self._modules_by_name = None
+        self._modules_by_prefix = None
+        self._find_module.cache_clear()
+    
+    def _get_modules(self) -> list[ModuleInfo]:
+        """Discover modules once and reuse the result until invalidated."""
+        if self._modules_cache is None:
+            modules = self._modules_controller.discover_modules()
+            # setdefault keeps the first module for a repeated name, as the
+            # linear scan this index replaced did
+            by_name: dict[str, ModuleInfo] = {}
+            by_prefix: defaultdict[str, list[ModuleInfo]] = defaultdict(list)
+            for module in modules:
+                by_name.setdefault(module.name, module)
+                by_prefix[Path(module.path).parts[0]].append(module)
+            self._modules_by_name = by_name
+            self._modules_by_prefix = dict(by_prefix)
+            self._modules_cache = modules
+        return self._modules_cache
+    
+    def _get_modules_by_name(self) -> dict[str, ModuleInfo]:
+        """Discovered modules indexed by name."""
+        self._get_modules()
+        return self._modules_by_name
+    
+    def find_modules_under(self, prefix: str) -> list[ModuleInfo]:
+        """
+        List discovered modules whose path starts with the given top-level folder.
+        
+        Args:
+            prefix: First path component, e.g. "cores" or "managers"
+            
+        Returns:
+            Matching modules in discovery order (empty if none)
+        """
+        self._get_modules()
+        return list(self._modules_by_prefix.get(prefix, ()))
+    
+    def _find_module_impl(self, module_name: str) -> Optional[ModuleInfo]:
+        """Find a module by name (memoized as _find_module)."""
+        return self._get_modules_by_name().get(module_name)
+    
     def preview_migration(self, module_name: str) -> Optional[str]:
         """
         Preview what pyproject.toml would be generated.